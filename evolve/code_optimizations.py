@@ -6,26 +6,121 @@ controlled via Cargo feature flags. Each optimization can be toggled
 independently to measure its impact.
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import IO, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 import subprocess
+import hashlib
+import heapq
+import itertools
 import json
+import os
+import shutil
+import signal
+import threading
+import uuid
 import logging
-import re
 from datetime import datetime
 
+try:
+    import orjson  # Optional: faster results serialization
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Benchmark groups that make up fitness (substrings of Criterion bench ids)
+_HOT_PATH_BENCHES = ("set_direct", "get_direct")
+
+# Warm per-feature-set Cargo target dirs to keep when opted in (each is ~1-2 GB)
+_MAX_TARGET_DIRS = 8
+
+# In-process bench results to remember, keyed by feature set
+_MAX_BENCH_MEMO = 64
+
+# Wall-clock limit for one bench run, in seconds
+_BENCH_TIMEOUT_S = 300
+
+# Wall-clock limit for one bench build, in seconds (a cold thin-LTO build of
+# the whole dependency graph on a share of the CPUs)
+_BUILD_TIMEOUT_S = 3600
+
+# Trailing non-result output lines kept for error reports
+_ERROR_TAIL_LINES = 50
+
+# Build settings pinned for every bench build, so timings don't depend on
+# the caller's shell. Codegen goes through CARGO_PROFILE_BENCH_* rather than
+# RUSTFLAGS: -Clto in RUSTFLAGS clashes with cargo's own -Cembed-bitcode=no.
+_BENCH_BUILD_ENV = {
+    "CARGO_INCREMENTAL": "0",
+    "CARGO_PROFILE_BENCH_LTO": "thin",
+    "CARGO_PROFILE_BENCH_CODEGEN_UNITS": "1",
+    "CARGO_PROFILE_BENCH_DEBUG": "false",
+    "CARGO_TERM_COLOR": "never",
+}
+
+# Caller flags that would override .cargo/config.toml rustflags wholesale
+_UNPINNED_ENV = ("RUSTFLAGS", "CARGO_ENCODED_RUSTFLAGS")
+
+# Joined with (not replacing) the rustflags in .cargo/config.toml
+_BENCH_RUSTFLAGS_CONFIG = "target.'cfg(all())'.rustflags = ['-Ctarget-cpu=native']"
+
+# Combinatorial progress lines buffered per log call
+_LOG_BATCH = 10
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj as indented JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """SIGKILL every process in proc's session (proc must lead its own)."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _parse_bencher_line(line: bytes) -> Optional[Tuple[str, float]]:
+    """
+    Parse one line of Criterion's bencher-format output.
+
+    Format: "test set_direct/key_len_16 ... bench:       1,234 ns/iter (+/- 56)"
+    Returns (bench_name, time_ns), or None for any other line.
+    """
+    parts = line.split()
+    if len(parts) < 6 or parts[0] != b"test" or parts[3] != b"bench:" or parts[5] != b"ns/iter":
+        return None
+    try:
+        time_ns = float(parts[4].replace(b",", b""))
+    except ValueError:
+        return None
+    return parts[1].decode("ascii", errors="replace"), time_ns
+
+
+def _read_median_ns(criterion_dir: Path, bench: str) -> Optional[float]:
+    """Return a bench's full-precision median from Criterion's estimates.json."""
+    try:
+        estimates = json.loads((criterion_dir / bench / "new" / "estimates.json").read_bytes())
+        return float(estimates["median"]["point_estimate"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
 class CodeOptimization:
     """Defines a code-level optimization."""
-    name: str                   # Feature flag name (e.g., "opt-single-key-alloc")
-    description: str            # What the optimization does
-    expected_gain: float        # Expected performance gain (0.0 - 1.0)
-    risk: str                   # Risk level: "low", "medium", "high"
-    files_modified: List[str]   # Files that need changes
-    priority: int               # Implementation priority (0 = highest)
+    name: str                       # Feature flag name (e.g., "opt-single-key-alloc")
+    description: str                # What the optimization does
+    expected_gain: float            # Expected performance gain (0.0 - 1.0)
+    risk: str                       # Risk level: "low", "medium", "high"
+    files_modified: Tuple[str, ...] # Files that need changes
+    priority: int                   # Implementation priority (0 = highest)
 
     def feature_flag(self) -> str:
         """Return the Cargo feature flag name."""
@@ -39,7 +134,7 @@ CODE_OPTIMIZATIONS: Dict[str, CodeOptimization] = {
         description="Single allocation in set_direct (eliminate double key.to_string())",
         expected_gain=0.04,  # 3-5% expected
         risk="low",
-        files_modified=["src/redis/commands.rs"],
+        files_modified=("src/redis/commands.rs",),
         priority=0,
     ),
     "opt-static-responses": CodeOptimization(
@@ -47,7 +142,7 @@ CODE_OPTIMIZATIONS: Dict[str, CodeOptimization] = {
         description="Static OK/PONG responses instead of allocating each time",
         expected_gain=0.015,  # 1-2% expected
         risk="low",
-        files_modified=["src/redis/commands.rs"],
+        files_modified=("src/redis/commands.rs",),
         priority=1,
     ),
     "opt-zero-copy-get": CodeOptimization(
@@ -55,7 +150,7 @@ CODE_OPTIMIZATIONS: Dict[str, CodeOptimization] = {
         description="Zero-copy GET response using Bytes/Arc instead of Vec clone",
         expected_gain=0.025,  # 2-3% expected
         risk="medium",
-        files_modified=["src/redis/commands.rs", "src/redis/data.rs"],
+        files_modified=("src/redis/commands.rs", "src/redis/data.rs"),
         priority=2,
     ),
     "opt-itoa-encode": CodeOptimization(
@@ -63,7 +158,7 @@ CODE_OPTIMIZATIONS: Dict[str, CodeOptimization] = {
         description="Use itoa crate for fast integer encoding in RESP responses",
         expected_gain=0.015,  # 1-2% expected
         risk="low",
-        files_modified=["src/production/connection_optimized.rs"],
+        files_modified=("src/production/connection_optimized.rs",),
         priority=3,
     ),
     "opt-fxhash-routing": CodeOptimization(
@@ -71,7 +166,7 @@ CODE_OPTIMIZATIONS: Dict[str, CodeOptimization] = {
         description="Use FxHash/AHash for faster shard routing",
         expected_gain=0.015,  # 1-2% expected
         risk="low",
-        files_modified=["src/production/sharded_actor.rs"],
+        files_modified=("src/production/sharded_actor.rs",),
         priority=4,
     ),
     "opt-atoi-parse": CodeOptimization(
@@ -79,22 +174,65 @@ CODE_OPTIMIZATIONS: Dict[str, CodeOptimization] = {
         description="Use atoi crate for fast integer parsing from bytes",
         expected_gain=0.03,  # 2-4% expected
         risk="low",
-        files_modified=["src/production/connection_optimized.rs"],
+        files_modified=("src/production/connection_optimized.rs",),
         priority=5,
     ),
 }
 
 
-@dataclass
+# Bit position of each optimization in OptimizationCandidate.mask
+_OPT_INDEX: Dict[str, int] = {name: i for i, name in enumerate(CODE_OPTIMIZATIONS)}
+_OPT_GAINS: Tuple[float, ...] = tuple(opt.expected_gain for opt in CODE_OPTIMIZATIONS.values())
+
+
+def _build_gain_lut(gains: Tuple[float, ...]) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Build one 256-entry table per mask byte.
+
+    _GAIN_LUT[k][b] is the summed gain of the bits set in b at byte k.
+    """
+    tables = []
+    for base in range(0, len(gains), 8):
+        chunk = gains[base:base + 8]
+        table = [0.0] * 256
+        for b in range(1, 256):
+            low = (b & -b).bit_length() - 1
+            table[b] = table[b & (b - 1)] + (chunk[low] if low < len(chunk) else 0.0)
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+_GAIN_LUT = _build_gain_lut(_OPT_GAINS)
+
+
+def _mask_gain(mask: int) -> float:
+    """Expected total gain of a mask: one table lookup per byte."""
+    total = 0.0
+    for table in _GAIN_LUT:
+        total += table[mask & 0xFF]
+        mask >>= 8
+    return total
+
+
+@dataclass(slots=True)
 class OptimizationCandidate:
     """A candidate configuration of enabled optimizations."""
-    enabled: Dict[str, bool]   # Map of optimization name -> enabled
+    mask: int                  # Bit _OPT_INDEX[name] set = optimization enabled
     fitness: Optional[float] = None
     generation: int = 0
+    _gain_cache: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._gain_cache = _mask_gain(self.mask)
+
+    @property
+    def enabled(self) -> Dict[str, bool]:
+        """Map of optimization name -> enabled (back-compat view)."""
+        return {name: bool(self.mask >> i & 1) for name, i in _OPT_INDEX.items()}
 
     def feature_flags(self) -> List[str]:
         """Return list of enabled feature flags."""
-        return [name for name, enabled in self.enabled.items() if enabled]
+        return [name for name, i in _OPT_INDEX.items() if self.mask & (1 << i)]
 
     def cargo_features(self) -> str:
         """Return comma-separated feature flags for cargo."""
@@ -104,12 +242,8 @@ class OptimizationCandidate:
         return ""
 
     def expected_total_gain(self) -> float:
-        """Calculate expected total gain from enabled optimizations."""
-        total = 0.0
-        for name, enabled in self.enabled.items():
-            if enabled and name in CODE_OPTIMIZATIONS:
-                total += CODE_OPTIMIZATIONS[name].expected_gain
-        return total
+        """Expected total gain from enabled optimizations (cached at construction)."""
+        return self._gain_cache
 
     def summary(self) -> str:
         """Short summary for logging."""
@@ -128,113 +262,475 @@ class OptimizationCandidate:
     @classmethod
     def from_dict(cls, data: Dict) -> "OptimizationCandidate":
         """Deserialize from dict."""
-        return cls(
-            enabled=data["enabled"],
+        return cls.from_enabled(
+            data["enabled"],
             fitness=data.get("fitness"),
             generation=data.get("generation", 0),
         )
 
+    @classmethod
+    def from_names(cls, names: Iterable[str], **kwargs) -> "OptimizationCandidate":
+        """Create from the names of enabled optimizations."""
+        mask = 0
+        for name in names:
+            if name in _OPT_INDEX:
+                mask |= 1 << _OPT_INDEX[name]
+        return cls(mask=mask, **kwargs)
+
+    @classmethod
+    def from_enabled(cls, enabled: Dict[str, bool], **kwargs) -> "OptimizationCandidate":
+        """Create from a map of optimization name -> enabled."""
+        return cls.from_names((name for name, on in enabled.items() if on), **kwargs)
+
     @classmethod
     def baseline(cls) -> "OptimizationCandidate":
         """Create baseline with all optimizations disabled."""
-        return cls(enabled={name: False for name in CODE_OPTIMIZATIONS})
+        return cls(mask=0)
 
     @classmethod
     def all_enabled(cls) -> "OptimizationCandidate":
         """Create candidate with all optimizations enabled."""
-        return cls(enabled={name: True for name in CODE_OPTIMIZATIONS})
+        return cls(mask=(1 << len(_OPT_INDEX)) - 1)
+
+
+def _combinations_by_expected_gain(max_combinations: int) -> Iterator[OptimizationCandidate]:
+    """
+    Yield up to max_combinations candidates in descending expected-gain order.
+
+    Best-first over toggles away from the best subset, so only O(K) subsets
+    are ever materialized.
+    """
+    best = sum(1 << i for i, gain in enumerate(_OPT_GAINS) if gain > 0)
+    # (cost of toggling, bit) for every optimization, cheapest first
+    ranked = sorted((abs(gain), 1 << i) for i, gain in enumerate(_OPT_GAINS))
+
+    if max_combinations <= 0:
+        return
+
+    # Heap entries: (cost of toggles, last ranked index toggled, toggle mask)
+    heap: List[Tuple[float, int, int]] = [(0.0, -1, 0)]
+    popped = 0
+
+    while heap and popped < max_combinations:
+        cost, last, toggled = heapq.heappop(heap)
+        popped += 1
+
+        yield OptimizationCandidate(mask=best ^ toggled)
+
+        nxt = last + 1
+        if nxt < len(ranked):
+            nxt_cost, nxt_bit = ranked[nxt]
+            heapq.heappush(heap, (cost + nxt_cost, nxt, toggled | nxt_bit))
+            if last >= 0:
+                last_cost, last_bit = ranked[last]
+                swapped = (toggled ^ last_bit) | nxt_bit
+                heapq.heappush(heap, (cost - last_cost + nxt_cost, nxt, swapped))
 
 
 class CriterionEvaluator:
     """
     Fast evaluator using Criterion benchmarks.
 
-    Provides sub-second feedback for code optimizations.
+    Provides sub-second feedback for code optimizations. Results are cached
+    per git SHA and toolchain under cache_dir (default: Cargo's target dir).
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(
+        self,
+        project_root: Path,
+        cache_dir: Optional[Path] = None,
+        per_feature_target_dirs: bool = False,
+    ):
         self.project_root = project_root
+        self.cache_dir = cache_dir
+        self.per_feature_target_dirs = per_feature_target_dirs
         self._baseline_results: Optional[Dict[str, float]] = None
+        self._baseline_items: Tuple[Tuple[str, float], ...] = ()
+        self._relevant_keys: Tuple[str, ...] = ()
+        self._sha = self._git_sha()
+        self._source_mtime: Optional[float] = None
+        self._build_key: Optional[str] = None
+        self._bench_memo: "OrderedDict[FrozenSet[str], Dict[str, float]]" = OrderedDict()
+        self._bench_bin: Dict[FrozenSet[str], Path] = {}
+        self._build_errors: Dict[FrozenSet[str], Exception] = {}
+        self._target_root: Optional[Path] = None
+        # LRU of per-feature-set target dirs, oldest first
+        self._target_dirs: Optional["OrderedDict[Path, None]"] = None
 
     def capture_baseline(self) -> Dict[str, float]:
         """Run benchmarks with no optimizations to establish baseline."""
         logger.info("Capturing Criterion baseline...")
         results = self._run_criterion_bench([])
         self._baseline_results = results
+        self._baseline_items = tuple(results.items())
+        self._relevant_keys = tuple(
+            bench for bench in results
+            if any(hp in bench for hp in _HOT_PATH_BENCHES)
+        )
         return results
 
-    def evaluate(self, candidate: OptimizationCandidate) -> Dict[str, float]:
+    @property
+    def relevant_keys(self) -> Tuple[str, ...]:
+        """Baseline benchmarks on the hot paths that fitness is computed from."""
+        return self._relevant_keys
+
+    def ensure_baseline(self) -> None:
+        """Capture the baseline if it has not been captured yet."""
+        if self._baseline_results is None:
+            self.capture_baseline()
+
+    def target_dir_for(self, features: List[str]) -> Path:
+        """
+        Return the Cargo target dir to build a feature set in.
+
+        One shared dir, or with per_feature_target_dirs one per feature set
+        (the least recently used beyond _MAX_TARGET_DIRS are deleted).
+        """
+        base = self._cargo_target_root()
+        if not self.per_feature_target_dirs:
+            return base / "evolve-bench"
+
+        if self._target_dirs is None:
+            existing = sorted(base.glob("feat-*"), key=lambda p: p.stat().st_mtime)
+            self._target_dirs = OrderedDict((p, None) for p in existing)
+
+        digest = hashlib.md5(",".join(sorted(features)).encode()).hexdigest()[:8]
+        target_dir = base / f"feat-{digest}"
+        self._target_dirs[target_dir] = None
+        self._target_dirs.move_to_end(target_dir)
+
+        while len(self._target_dirs) > _MAX_TARGET_DIRS:
+            evicted, _ = self._target_dirs.popitem(last=False)
+            logger.debug(f"Evicting target dir: {evicted}")
+            shutil.rmtree(evicted, ignore_errors=True)
+
+        return target_dir
+
+    def worker_target_dir(self, slot: int) -> Path:
+        """Return the Cargo target dir owned by parallel worker `slot`."""
+        return self._cargo_target_root() / f"evolve-bench-w{slot}"
+
+    def needs_build(self, features: List[str]) -> bool:
+        """Whether benchmarking a feature set would have to build it first."""
+        key = frozenset(features)
+        return (
+            self._cached_bench(features) is None
+            and key not in self._bench_bin
+            and key not in self._build_errors
+        )
+
+    def build_bench(
+        self,
+        features: List[str],
+        target_dir: Path,
+        build_jobs: Optional[int] = None,
+    ) -> Path:
+        """
+        Build (without running) the bench for a feature set.
+
+        Meant for worker processes: the parent hands the returned
+        executable to add_bench_binary and benchmarks it itself.
+        """
+        return self._bench_binary(features, self._bench_env(target_dir, build_jobs))
+
+    def add_bench_binary(self, features: List[str], bench_bin: Path) -> None:
+        """Register a bench executable built elsewhere."""
+        self._bench_bin[frozenset(features)] = bench_bin
+
+    def add_build_error(self, features: List[str], error: Exception) -> None:
+        """Register a failed build elsewhere; evaluating the set re-raises it."""
+        self._build_errors[frozenset(features)] = error
+
+    def evaluate(
+        self,
+        candidate: OptimizationCandidate,
+        target_dir: Optional[Path] = None,
+    ) -> Dict[str, float]:
         """
         Evaluate candidate using Criterion benchmarks.
 
+        Args:
+            candidate: Candidate whose feature flags are benchmarked
+            target_dir: Cargo target dir to build in (default: target_dir_for)
+
         Returns dict of benchmark -> relative performance (1.0 = baseline).
         """
         features = candidate.feature_flags()
-        results = self._run_criterion_bench(features)
+        results = self._run_criterion_bench(features, target_dir)
 
-        if self._baseline_results is None:
-            self.capture_baseline()
+        self.ensure_baseline()
 
-        # Calculate relative performance
+        # Calculate relative performance against each baseline benchmark
         relative = {}
-        for bench, time_ns in results.items():
-            if bench in self._baseline_results:
-                baseline = self._baseline_results[bench]
-                # Lower time is better, so invert the ratio
-                relative[bench] = baseline / time_ns if time_ns > 0 else 1.0
-            else:
-                relative[bench] = 1.0
+        for bench, baseline in self._baseline_items:
+            time_ns = results.get(bench)
+            # Lower time is better, so invert the ratio
+            relative[bench] = baseline / time_ns if time_ns else 1.0
 
         return relative
 
-    def _run_criterion_bench(self, features: List[str]) -> Dict[str, float]:
+    def _run_criterion_bench(
+        self,
+        features: List[str],
+        target_dir: Optional[Path] = None,
+    ) -> Dict[str, float]:
         """Run Criterion benchmarks and parse results."""
-        cmd = ["cargo", "bench", "--bench", "hot_paths"]
+        cached = self._cached_bench(features)
+        if cached is not None:
+            return cached
 
-        if features:
-            cmd.extend(["--features", ",".join(features)])
+        if target_dir is None:
+            target_dir = self.target_dir_for(features)
+        env = self._bench_env(target_dir)
 
-        # Run with JSON output for parsing
-        cmd.extend(["--", "--noplot"])
+        bench_bin = self._bench_binary(features, env)
 
-        logger.debug(f"Running: {' '.join(cmd)}")
+        # Run the bench binary directly, skipping cargo's workspace
+        # resolution; bencher format is one machine-readable line per bench
+        cmd = [str(bench_bin), "--bench", "--output-format", "bencher", "--noplot"]
+        criterion_dir = target_dir / "criterion"
+        env["CRITERION_HOME"] = str(criterion_dir)
 
-        result = subprocess.run(
-            cmd,
-            cwd=self.project_root,
-            capture_output=True,
-            text=True,
-            timeout=300,
-        )
+        results = {}
 
-        if result.returncode != 0:
-            logger.error(f"Benchmark failed: {result.stderr}")
-            return {}
+        def on_line(line: bytes) -> bool:
+            parsed = _parse_bencher_line(line)
+            if parsed is None:
+                return False
+            results[parsed[0]] = parsed[1]
+            return True
+
+        returncode, output = self._stream_command(cmd, env, on_line, _BENCH_TIMEOUT_S)
+        if returncode != 0:
+            raise RuntimeError(f"Benchmark failed: {output}")
+        if not results:
+            raise RuntimeError("No benchmark results found")
+
+        # Bencher lines truncate to whole ns, which is several percent of
+        # a hot-path bench; keep them only as a fallback
+        for bench in results:
+            median = _read_median_ns(criterion_dir, bench)
+            if median is not None:
+                results[bench] = median
+
+        cache_path = self._bench_cache_path(features)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(results))
+        tmp_path.replace(cache_path)
+        self._remember_bench(frozenset(features), results)
 
-        # Parse Criterion output
-        return self._parse_criterion_output(result.stdout)
+        return results
 
-    def _parse_criterion_output(self, output: str) -> Dict[str, float]:
-        """Parse Criterion benchmark output to extract timings."""
-        results = {}
+    def _cached_bench(self, features: List[str]) -> Optional[Dict[str, float]]:
+        """Return memoized or disk-cached results for a feature set, if any."""
+        key = frozenset(features)
+        hit = self._bench_memo.get(key)
+        if hit is not None:
+            return hit
+
+        cache_path = self._bench_cache_path(features)
+        cached = self._load_cached_bench(cache_path)
+        if cached is not None:
+            logger.debug(f"Using cached results: {cache_path}")
+            self._remember_bench(key, cached)
+        return cached
+
+    def _bench_env(self, target_dir: Path, build_jobs: Optional[int] = None) -> Dict[str, str]:
+        """Environment for bench builds and runs, pinned against the caller's."""
+        env = {k: v for k, v in os.environ.items() if k not in _UNPINNED_ENV}
+        env.update(_BENCH_BUILD_ENV, CARGO_TARGET_DIR=str(target_dir))
+        if build_jobs is not None:
+            env["CARGO_BUILD_JOBS"] = str(build_jobs)
+        return env
+
+    def _bench_binary(self, features: List[str], env: Dict[str, str]) -> Path:
+        """
+        Build the hot_paths bench for a feature set and return its executable.
 
-        # Pattern: "bench_name       time:   [123.45 ns 124.56 ns 125.67 ns]"
-        pattern = r"(\w+/\w+)\s+time:\s+\[\d+\.\d+ \w+ (\d+\.\d+) (ns|µs|ms)"
+        Built once per feature set per process; later runs of the same set
+        reuse the binary without invoking cargo at all.
+        """
+        key = frozenset(features)
+        error = self._build_errors.get(key)
+        if error is not None:
+            raise error
+        bench_bin = self._bench_bin.get(key)
+        if bench_bin is not None and bench_bin.exists():
+            return bench_bin
+
+        cmd = [
+            "cargo", "bench", "--bench", "hot_paths", "--no-run",
+            "--message-format=json-render-diagnostics",
+            "--config", _BENCH_RUSTFLAGS_CONFIG,
+        ]
+        if features:
+            cmd.extend(["--features", ",".join(features)])
 
-        for match in re.finditer(pattern, output):
-            bench_name = match.group(1)
-            time_val = float(match.group(2))
-            unit = match.group(3)
+        executables: List[str] = []
 
-            # Normalize to nanoseconds
-            if unit == "µs":
-                time_val *= 1000
-            elif unit == "ms":
-                time_val *= 1_000_000
+        def on_line(line: bytes) -> bool:
+            if not line.startswith(b"{"):
+                return False
+            try:
+                message = json.loads(line)
+            except ValueError:
+                return False
+            if (message.get("reason") == "compiler-artifact"
+                    and "bench" in message["target"]["kind"]
+                    and message.get("executable")):
+                executables.append(message["executable"])
+            return True
+
+        returncode, output = self._stream_command(cmd, env, on_line, _BUILD_TIMEOUT_S)
+        if returncode != 0 or not executables:
+            raise RuntimeError(f"Benchmark build failed: {output}")
+
+        bench_bin = Path(executables[-1])
+        self._bench_bin[key] = bench_bin
+        return bench_bin
+
+    def _stream_command(
+        self,
+        cmd: List[str],
+        env: Dict[str, str],
+        on_line: Callable[[bytes], bool],
+        timeout: float,
+    ) -> Tuple[int, str]:
+        """
+        Run cmd in its own process group, passing each output line to on_line.
 
-            results[bench_name] = time_val
+        Returns (exit code, tail of unconsumed output). Raises
+        subprocess.TimeoutExpired after timeout seconds.
+        """
+        logger.debug(f"Running: {' '.join(cmd)}")
 
-        return results
+        proc = subprocess.Popen(
+            cmd,
+            cwd=self.project_root,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+        timed_out = threading.Event()
+
+        def on_timeout() -> None:
+            timed_out.set()
+            _kill_process_group(proc)
+
+        timer = threading.Timer(timeout, on_timeout)
+        timer.start()
+
+        tail = deque(maxlen=_ERROR_TAIL_LINES)
+        returncode = None
+        try:
+            with proc.stdout:
+                for line in proc.stdout:
+                    if not on_line(line):
+                        tail.append(line)
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            if returncode is None:
+                # Exception or Ctrl-C while streaming: don't leave cargo running
+                _kill_process_group(proc)
+                proc.wait()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        return returncode, b"".join(tail).decode(errors="replace")
+
+    def _cargo_target_root(self) -> Path:
+        """Cargo's target directory for the workspace, resolved once via cargo metadata."""
+        if self._target_root is None:
+            self._target_root = self.project_root / "target"
+            try:
+                result = subprocess.run(
+                    ["cargo", "metadata", "--format-version=1", "--no-deps"],
+                    cwd=self.project_root,
+                    capture_output=True,
+                    timeout=60,
+                )
+                if result.returncode == 0:
+                    self._target_root = Path(json.loads(result.stdout)["target_directory"])
+            except (OSError, ValueError, KeyError, subprocess.SubprocessError):
+                pass
+        return self._target_root
+
+    def _remember_bench(self, key: FrozenSet[str], results: Dict[str, float]) -> None:
+        """Memoize results for this process, evicting the oldest entry when full."""
+        self._bench_memo[key] = results
+        while len(self._bench_memo) > _MAX_BENCH_MEMO:
+            self._bench_memo.popitem(last=False)
+
+    def _bench_cache_path(self, features: List[str]) -> Path:
+        """Return the on-disk cache file for a feature set."""
+        if self.cache_dir is None:
+            self.cache_dir = self._cargo_target_root() / "evolve-cache"
+        digest = hashlib.sha256(",".join(sorted(features)).encode()).hexdigest()
+        return self.cache_dir / self._sha / self._bench_build_key() / f"{digest}.json"
+
+    def _bench_build_key(self) -> str:
+        """Hash of `rustc -vV` and the pinned bench build settings (computed once)."""
+        if self._build_key is None:
+            try:
+                result = subprocess.run(
+                    ["rustc", "-vV"],
+                    cwd=self.project_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=60,
+                )
+                rustc = result.stdout if result.returncode == 0 else "unknown"
+            except (OSError, subprocess.SubprocessError):
+                rustc = "unknown"
+            pinned = json.dumps([rustc, _BENCH_BUILD_ENV, _BENCH_RUSTFLAGS_CONFIG], sort_keys=True)
+            self._build_key = hashlib.sha256(pinned.encode()).hexdigest()[:16]
+        return self._build_key
+
+    def _load_cached_bench(self, cache_path: Path) -> Optional[Dict[str, float]]:
+        """Load cached results if they are newer than every bench input."""
+        try:
+            if cache_path.stat().st_mtime <= self._newest_source_mtime():
+                return None
+            return json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _newest_source_mtime(self) -> float:
+        """Newest mtime across Cargo manifests, build config and Rust sources (computed once)."""
+        if self._source_mtime is None:
+            root = self.project_root
+            paths = [
+                root / "Cargo.toml",
+                root / "Cargo.lock",
+                root / ".cargo" / "config.toml",
+                root / "rust-toolchain.toml",
+                root / "rust-toolchain",
+            ]
+            paths.extend(root.glob("src/**/*.rs"))
+            paths.extend(root.glob("benches/**/*.rs"))
+            self._source_mtime = max(
+                (p.stat().st_mtime for p in paths if p.exists()),
+                default=0.0,
+            )
+        return self._source_mtime
+
+    def _git_sha(self) -> str:
+        """Return the HEAD commit of project_root, or "unknown" outside git."""
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return "unknown"
+        return result.stdout.strip() if result.returncode == 0 else "unknown"
 
 
 class CodeOptimizationEvolver:
@@ -251,6 +747,9 @@ class CodeOptimizationEvolver:
         results_dir: Path = Path("evolve/results/code_opt"),
         use_criterion: bool = True,
         use_docker: bool = False,
+        jobs: Optional[int] = None,
+        noise_floor: float = 0.01,
+        per_feature_target_dirs: bool = False,
     ):
         self.project_root = project_root
         self.results_dir = results_dir
@@ -258,12 +757,30 @@ class CodeOptimizationEvolver:
 
         self.use_criterion = use_criterion
         self.use_docker = use_docker
+        # Expected gain Criterion can't resolve from run-to-run noise
+        self.noise_floor = noise_floor
+        if per_feature_target_dirs:
+            # Workers build in per-slot dirs, which would bypass the flag
+            if jobs not in (None, 1):
+                raise ValueError("per_feature_target_dirs requires jobs=1")
+            jobs = 1
+        # Bench runs are CPU-heavy themselves, so don't oversubscribe
+        self.jobs = jobs or max(1, (os.cpu_count() or 2) // 2)
 
         if use_criterion:
-            self.criterion_eval = CriterionEvaluator(project_root)
+            self.criterion_eval = CriterionEvaluator(
+                project_root,
+                per_feature_target_dirs=per_feature_target_dirs,
+            )
 
         self._history: List[Dict] = []
+        # Unique even for evolvers started in the same second
+        self.run_id = f"{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}"
+        self.history_file = self.results_dir / f"code_opt_{self.run_id}.jsonl"
+        # Append-only, line-buffered log opened by the first record
+        self._jsonl: Optional[IO[str]] = None
         self._best: Optional[OptimizationCandidate] = None
+        self._log_buf: List[str] = []
 
     def run_incremental(self) -> OptimizationCandidate:
         """
@@ -274,18 +791,21 @@ class CodeOptimizationEvolver:
         """
         logger.info("Starting incremental code optimization evolution")
 
+        if not self.use_criterion:
+            return self._fast_mock_incremental()
+
         # Sort optimizations by priority
         opts = sorted(
             CODE_OPTIMIZATIONS.values(),
             key=lambda o: o.priority
         )
+        opts = self._above_noise_floor(opts)
 
         # Start with baseline
         current = OptimizationCandidate.baseline()
 
-        if self.use_criterion:
-            baseline_results = self.criterion_eval.capture_baseline()
-            logger.info(f"Baseline captured: {len(baseline_results)} benchmarks")
+        baseline_results = self.criterion_eval.capture_baseline()
+        logger.info(f"Baseline captured: {len(baseline_results)} benchmarks")
 
         current.fitness = 100.0  # Baseline = 100%
         self._best = current
@@ -299,28 +819,20 @@ class CodeOptimizationEvolver:
 
             # Create candidate with this optimization enabled
             test = OptimizationCandidate(
-                enabled={**current.enabled, opt.name: True},
+                mask=current.mask | 1 << _OPT_INDEX[opt.name],
                 generation=opt.priority + 1,
             )
 
             # Evaluate
             try:
-                if self.use_criterion:
-                    relative = self.criterion_eval.evaluate(test)
-                    # Average relative performance across hot path benchmarks
-                    hot_paths = ["set_direct", "get_direct"]
-                    relevant = [v for k, v in relative.items()
-                               if any(hp in k for hp in hot_paths)]
-                    avg_improvement = sum(relevant) / len(relevant) if relevant else 1.0
-                    test.fitness = current.fitness * avg_improvement
-                else:
-                    # Mock fitness based on expected gain
-                    test.fitness = current.fitness * (1 + opt.expected_gain)
+                relative = self.criterion_eval.evaluate(test)
+                test.fitness = current.fitness * self._hot_path_speedup(relative)
 
                 logger.info(f"  Result: {test.fitness:.1f}% (was {current.fitness:.1f}%)")
 
                 # Accept if improvement
-                if test.fitness > current.fitness:
+                accepted = test.fitness > current.fitness
+                if accepted:
                     improvement = test.fitness - current.fitness
                     logger.info(f"  ACCEPTED: +{improvement:.2f}%")
                     current = test
@@ -329,16 +841,16 @@ class CodeOptimizationEvolver:
                     logger.info(f"  REJECTED: no improvement")
 
                 # Record history
-                self._history.append({
+                self._record({
                     "optimization": opt.name,
                     "tested_fitness": test.fitness,
-                    "accepted": test.fitness > current.fitness,
+                    "accepted": accepted,
                     "current_best": current.fitness,
                 })
 
             except Exception as e:
                 logger.error(f"  FAILED: {e}")
-                self._history.append({
+                self._record({
                     "optimization": opt.name,
                     "error": str(e),
                 })
@@ -348,85 +860,201 @@ class CodeOptimizationEvolver:
 
         return self._best
 
+    def _hot_path_speedup(self, relative: Dict[str, float]) -> float:
+        """Average relative performance across hot path benchmarks."""
+        relevant = [relative[k] for k in self.criterion_eval.relevant_keys if k in relative]
+        return sum(relevant) / len(relevant) if relevant else 1.0
+
+    def _above_noise_floor(self, opts: List[CodeOptimization]) -> List[CodeOptimization]:
+        """
+        Drop the tail of opts whose summed expected gain is below the noise floor.
+
+        Benchmarking those cannot change the outcome, since any gain they
+        deliver is indistinguishable from Criterion's measurement noise.
+        """
+        remaining = sum(opt.expected_gain for opt in opts)
+        for i, opt in enumerate(opts):
+            if remaining < self.noise_floor:
+                logger.info(
+                    f"Remaining expected gain {remaining:.3f} < noise floor "
+                    f"{self.noise_floor:.3f}; skipping {len(opts) - i} optimizations"
+                )
+                return opts[:i]
+            remaining -= opt.expected_gain
+        return opts
+
+    def _fast_mock_incremental(self) -> OptimizationCandidate:
+        """
+        Closed-form run_incremental for the mock evaluator.
+
+        The mock scores each step as current * (1 + expected_gain), so an
+        optimization is accepted exactly when its expected gain is positive
+        and the final fitness is 100% times the product of accepted factors.
+        """
+        opts = sorted(CODE_OPTIMIZATIONS.values(), key=lambda o: o.priority)
+        opts = self._above_noise_floor(opts)
+        accepted = [opt for opt in opts if opt.expected_gain > 0]
+
+        # Fitness before and after each step, starting from baseline = 100%
+        fitness = list(itertools.accumulate(
+            opts,
+            lambda f, o: f * (1 + o.expected_gain) if o.expected_gain > 0 else f,
+            initial=100.0,
+        ))
+        for opt, before, after in zip(opts, fitness, fitness[1:]):
+            self._record({
+                "optimization": opt.name,
+                "tested_fitness": before * (1 + opt.expected_gain),
+                "accepted": opt.expected_gain > 0,
+                "current_best": after,
+            })
+
+        self._best = OptimizationCandidate.from_names(
+            (opt.name for opt in accepted),
+            generation=accepted[-1].priority + 1 if accepted else 0,
+        )
+        self._best.fitness = fitness[-1]
+        logger.info(f"Mock evaluator accepts {len(accepted)}/{len(opts)} optimizations")
+
+        self._save_results()
+
+        return self._best
+
     def run_combinatorial(self, max_combinations: int = 64) -> OptimizationCandidate:
         """
         Test combinations of optimizations.
 
         For N optimizations, there are 2^N combinations. This tests
-        the most promising combinations based on expected gains.
+        the most promising combinations based on expected gains, streamed
+        best-first so the power set is never materialized.
         """
         logger.info("Starting combinatorial code optimization search")
 
-        # Generate all combinations, sorted by expected total gain
-        from itertools import combinations
-
-        all_opts = list(CODE_OPTIMIZATIONS.keys())
-        candidates = []
-
-        # Generate power set (all combinations)
-        for r in range(len(all_opts) + 1):
-            for combo in combinations(all_opts, r):
-                enabled = {name: name in combo for name in all_opts}
-                cand = OptimizationCandidate(enabled=enabled)
-                candidates.append(cand)
-
-        # Sort by expected gain (descending)
-        candidates.sort(key=lambda c: c.expected_total_gain(), reverse=True)
+        # Stream combinations in descending expected-gain order
+        candidates = _combinations_by_expected_gain(max_combinations)
+        total = min(max_combinations, 1 << len(_OPT_INDEX))
 
-        # Limit to max_combinations
-        candidates = candidates[:max_combinations]
+        if self.use_criterion and self.jobs > 1:
+            logger.info(f"Testing {total} combinations, building on {self.jobs} workers")
+            candidates = self._build_ahead(candidates)
+        else:
+            logger.info(f"Testing {total} combinations")
 
-        logger.info(f"Testing {len(candidates)} combinations")
+        # Progress is batched into one log call per _LOG_BATCH candidates
+        # (or per new best); with INFO disabled nothing is formatted at all
+        log_progress = logger.isEnabledFor(logging.INFO)
 
         best = None
         for i, cand in enumerate(candidates):
-            logger.info(f"\n[{i+1}/{len(candidates)}] Testing: {cand.summary()}")
-            logger.info(f"  Expected gain: {cand.expected_total_gain()*100:.1f}%")
-
             try:
                 if self.use_criterion:
                     relative = self.criterion_eval.evaluate(cand)
-                    # Calculate fitness from relevant benchmarks
-                    hot_paths = ["set_direct", "get_direct"]
-                    relevant = [v for k, v in relative.items()
-                               if any(hp in k for hp in hot_paths)]
-                    cand.fitness = 100.0 * (sum(relevant) / len(relevant) if relevant else 1.0)
+                    cand.fitness = 100.0 * self._hot_path_speedup(relative)
                 else:
                     cand.fitness = 100.0 * (1 + cand.expected_total_gain())
 
-                logger.info(f"  Fitness: {cand.fitness:.1f}%")
-
-                if best is None or cand.fitness > best.fitness:
+                new_best = best is None or cand.fitness > best.fitness
+                if new_best:
                     best = cand
-                    logger.info(f"  NEW BEST!")
 
-                self._history.append({
+                if log_progress:
+                    self._log_buf.append(
+                        f"[{i+1}/{total}] {cand.summary()}: {cand.fitness:.1f}% "
+                        f"(expected +{cand.expected_total_gain()*100:.1f}%)"
+                        + (" NEW BEST!" if new_best else "")
+                    )
+                    if new_best or len(self._log_buf) >= _LOG_BATCH:
+                        self._flush_log()
+
+                self._record({
                     "combination": cand.summary(),
                     "fitness": cand.fitness,
                     "enabled": cand.enabled,
                 })
 
             except Exception as e:
-                logger.error(f"  FAILED: {e}")
+                self._flush_log()
+                logger.error(f"[{i+1}/{total}] {cand.summary()} FAILED: {e}")
 
+        self._flush_log()
         self._best = best
         self._save_results()
 
         return best
 
+    def _flush_log(self) -> None:
+        """Emit buffered progress lines as a single log record."""
+        if self._log_buf:
+            logger.info("\n".join(self._log_buf))
+            self._log_buf.clear()
+
+    def _build_ahead(
+        self,
+        candidates: Iterator[OptimizationCandidate],
+    ) -> Iterator[OptimizationCandidate]:
+        """
+        Build candidates' benches on a process pool, yielding each batch once built.
+
+        The caller benchmarks the yielded candidates one at a time before the
+        next batch is built.
+        """
+        # Capture before any parallel build so it also runs alone
+        self.criterion_eval.ensure_baseline()
+
+        build_jobs = max(1, (os.cpu_count() or 1) // self.jobs)
+
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            while True:
+                batch = list(itertools.islice(candidates, self.jobs))
+                if not batch:
+                    return
+
+                pending: Dict[Future, List[str]] = {}
+                for slot, cand in enumerate(batch):
+                    features = cand.feature_flags()
+                    if not self.criterion_eval.needs_build(features):
+                        continue
+                    future = pool.submit(
+                        self.criterion_eval.build_bench,
+                        features,
+                        self.criterion_eval.worker_target_dir(slot),
+                        build_jobs,
+                    )
+                    pending[future] = features
+
+                for future in as_completed(pending):
+                    features = pending[future]
+                    try:
+                        self.criterion_eval.add_bench_binary(features, future.result())
+                    except Exception as e:
+                        # Re-raised when the candidate is evaluated, so it is
+                        # reported FAILED exactly as in a serial run
+                        self.criterion_eval.add_build_error(features, e)
+
+                yield from batch
+
+    def _record(self, record: Dict) -> None:
+        """Add a history record and persist it to the JSONL log immediately."""
+        self._history.append(record)
+        if self._jsonl is None:
+            self._jsonl = self.history_file.open("a", buffering=1)
+        self._jsonl.write(json.dumps(record) + "\n")
+
     def _save_results(self) -> None:
-        """Save evolution results."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        """Save the evolution summary (history is already in history_file)."""
+        if self._jsonl is not None:
+            self._jsonl.close()
+            self._jsonl = None
 
         results = {
             "completed_at": datetime.now().isoformat(),
             "best_candidate": self._best.to_dict() if self._best else None,
             "best_features": self._best.feature_flags() if self._best else [],
-            "history": self._history,
+            "history_file": str(self.history_file),
         }
 
-        output_file = self.results_dir / f"code_opt_{timestamp}.json"
-        output_file.write_text(json.dumps(results, indent=2))
+        output_file = self.results_dir / f"code_opt_{self.run_id}.json"
+        output_file.write_bytes(_dumps(results))
         logger.info(f"Results saved to: {output_file}")
 
         # Also save best features to a shell script for easy use
@@ -473,9 +1101,23 @@ def main():
         default=Path("evolve/results/code_opt"),
         help="Output directory"
     )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None,
+        help="Parallel bench builds for combinatorial mode; benches still run one at a time (default: half the CPUs)"
+    )
+    parser.add_argument(
+        "--per-feature-target-dirs", action="store_true",
+        help="Build each feature set in its own Cargo target dir (cold build per set, ~1-2 GB each; implies --jobs 1)"
+    )
+    parser.add_argument(
+        "--noise-floor", type=float, default=0.01,
+        help="Stop incremental mode once remaining expected gain is below this (default: 0.01)"
+    )
     parser.add_argument("--verbose", "-v", action="store_true")
 
     args = parser.parse_args()
+    if args.per_feature_target_dirs and args.jobs not in (None, 1):
+        parser.error("--per-feature-target-dirs requires --jobs 1")
 
     logging.basicConfig(
         level=logging.DEBUG if args.verbose else logging.INFO,
@@ -488,6 +1130,9 @@ def main():
         project_root=project_root,
         results_dir=args.output,
         use_criterion=not args.mock,
+        jobs=args.jobs,
+        noise_floor=args.noise_floor,
+        per_feature_target_dirs=args.per_feature_target_dirs,
     )
 
     print()